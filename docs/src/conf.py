@@ -5,10 +5,15 @@ https://www.sphinx-doc.org/en/master/usage/configuration.html
 """
 
 import datetime
+import hashlib
 import importlib.metadata
 import pathlib
 import sys
 import tomllib
+import typing
+
+if typing.TYPE_CHECKING:
+    from sphinx.application import Sphinx
 
 PROJECT_ROOT_DIR = pathlib.Path(__file__).parent.parent.parent
 sys.path.insert(0, str((PROJECT_ROOT_DIR / "src").resolve()))
@@ -68,4 +73,37 @@ autodoc_default_options = {
     "show-inheritance": True,
 }
 
-autosummary_generate = True
+# Regenerating the autosummary stubs re-imports and re-introspects
+# every module of the package. Fingerprint the package sources and
+# only regenerate when they actually changed, so incremental builds
+# skip that work entirely.
+AUTOSUMMARY_DIR = pathlib.Path(__file__).parent / "_autosummary"
+FINGERPRINT_FILE = AUTOSUMMARY_DIR / ".fingerprint"
+
+
+def _source_fingerprint() -> str:
+    digest = hashlib.sha256()
+    for path in sorted((PROJECT_ROOT_DIR / "src").rglob("*.py")):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+_fingerprint = _source_fingerprint()
+autosummary_generate = (
+    not FINGERPRINT_FILE.is_file()
+    or FINGERPRINT_FILE.read_text() != _fingerprint
+)
+
+
+def _write_fingerprint(_app: Sphinx, exception: Exception | None) -> None:
+    # Record the fingerprint only after the build - and with it the
+    # stub generation - actually succeeded. Writing it any earlier
+    # would make builds after an interrupted one skip regeneration.
+    if exception is None and autosummary_generate:
+        AUTOSUMMARY_DIR.mkdir(parents=True, exist_ok=True)
+        FINGERPRINT_FILE.write_text(_fingerprint)
+
+
+def setup(app: Sphinx) -> None:
+    """Register the fingerprint bookkeeping with the build."""
+    app.connect("build-finished", _write_fingerprint)
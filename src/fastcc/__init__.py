@@ -30,6 +30,7 @@ from fastcc.constants import STATUS_CODE_FAILURE, STATUS_CODE_SUCCESS
 from fastcc.exceptions import FastCCError, MqttConnectionError, RequestError
 from fastcc.qos import QoS
 from fastcc.router import Routable, Router
+from fastcc.utilities import install_fast_event_loop
 
 __all__ = [
     "STATUS_CODE_FAILURE",
@@ -46,4 +47,5 @@ __all__ = [
     "StreamContext",
     "SubscribeContext",
     "UnsubscribeContext",
+    "install_fast_event_loop",
 ]
@@ -10,7 +10,7 @@ import uuid
 
 if typing.TYPE_CHECKING:
     import types
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Iterable
 
     from fastcc.codec_registry import CodecRegistry
 
@@ -33,6 +33,8 @@ from fastcc.utilities import get_correlation_id
 
 _logger = logging.getLogger(__name__)
 
+_QOS_BY_VALUE = {qos.value: qos for qos in QoS}
+
 
 class Client:
     """Asynchronous client to connect and communicate with an MQTT broker.
@@ -66,6 +68,19 @@ class Client:
     broker.
     """
 
+    __slots__ = (
+        "_client",
+        "_codec_registry",
+        "_host",
+        "_inflight",
+        "_listener",
+        "_messages",
+        "_pending_responses",
+        "_pending_responses_queue",
+        "_port",
+        "_response_topic",
+    )
+
     def __init__(
         self,
         host: str = DEFAULT_MQTT_HOST,
@@ -98,6 +113,7 @@ class Client:
 
         self._client = aiomqtt.Client(host, port, **kwargs)
         self._listener: asyncio.Task[None] | None = None
+        self._inflight: set[asyncio.Task[None]] = set()
         self._messages: asyncio.Queue[aiomqtt.Message] = asyncio.Queue()
         self._pending_responses: dict[
             bytes,
@@ -267,6 +283,9 @@ class Client:
         >>> async with Client() as client:
         ...     ...
         """
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
         if self._listener is not None:
             self._listener.cancel()
             with contextlib.suppress(asyncio.CancelledError):
@@ -305,7 +324,7 @@ class Client:
         payload = self._codec_registry.encode(value)
 
         if context is None:
-            context = PublishContext()
+            context = _DEFAULT_PUBLISH_CONTEXT
 
         try:
             await self._client.publish(
@@ -323,11 +342,76 @@ class Client:
             )
             raise FastCCError(error_message) from exc
 
-        _logger.debug(
-            "Published to topic '%s' with QoS %d ('%s')",
-            topic,
-            context.qos.value,
-            context.qos.name,
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "Published to topic '%s' with QoS %d ('%s')",
+                topic,
+                context.qos.value,
+                context.qos.name,
+            )
+
+    def publish_nowait(
+        self,
+        topic: str,
+        value: typing.Any = None,
+        *,
+        context: PublishContext | None = None,
+    ) -> None:
+        """Publish ``value`` to the given ``topic`` without awaiting.
+
+        The publish operation is scheduled on the running event loop
+        and this method returns immediately. This is intended for
+        QoS 0 publishes, where the broker sends no acknowledgement and
+        awaiting each publish only serializes the send path. Failures
+        are logged instead of raised. Publishes that are still in
+        flight when the client is stopped are awaited before
+        disconnecting.
+
+        Parameters
+        ----------
+        topic
+            The topic ``value`` should be published on.
+        value
+            The value to send. If ``None``, an empty payload is
+            published. The value is tried to be converted by one of the
+            registered codecs.
+        context
+            Context for the publish operation.
+        """
+        task = asyncio.create_task(self.publish(topic, value, context=context))
+        self._inflight.add(task)
+        task.add_done_callback(self.__reap_publish)
+
+    def __reap_publish(self, task: asyncio.Task[None]) -> None:
+        self._inflight.discard(task)
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            _logger.warning("Fire-and-forget publish failed: %s", exc)
+
+    async def publish_many(
+        self,
+        messages: Iterable[tuple[str, typing.Any]],
+        *,
+        context: PublishContext | None = None,
+    ) -> None:
+        """Publish several values concurrently.
+
+        All publish operations are issued at once and awaited together,
+        so a burst of small messages pays one round of task switching
+        instead of one per message. The broker may deliver the messages
+        in any order.
+
+        Parameters
+        ----------
+        messages
+            Pairs of topic and value to publish.
+        context
+            Context applied to every publish operation.
+        """
+        await asyncio.gather(
+            *(
+                self.publish(topic, value, context=context)
+                for topic, value in messages
+            ),
         )
 
     async def subscribe(
@@ -351,7 +435,7 @@ class Client:
             If the subscribe operation fails.
         """
         if context is None:
-            context = SubscribeContext()
+            context = _DEFAULT_SUBSCRIBE_CONTEXT
 
         try:
             await self._client.subscribe(
@@ -367,12 +451,13 @@ class Client:
             )
             raise FastCCError(error_message) from exc
 
-        _logger.debug(
-            "Subscribed to topic '%s' with QoS %d ('%s')",
-            topic,
-            context.qos.value,
-            context.qos.name,
-        )
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "Subscribed to topic '%s' with QoS %d ('%s')",
+                topic,
+                context.qos.value,
+                context.qos.name,
+            )
 
     async def unsubscribe(
         self,
@@ -395,7 +480,7 @@ class Client:
             If the unsubscribe operation fails.
         """
         if context is None:
-            context = UnsubscribeContext()
+            context = _DEFAULT_UNSUBSCRIBE_CONTEXT
 
         try:
             await self._client.unsubscribe(
@@ -544,9 +629,16 @@ class Client:
         await self.subscribe(self._response_topic, context=context)
         try:
             _logger.info("Started listening")
+
+            # Hoist per-message lookups out of the ingest loop.
+            response_topic = self._response_topic
+            put_message = self._messages.put
+            pending_responses = self._pending_responses
+            pending_response_queues = self._pending_responses_queue
+
             async for message in self._client.messages:
-                if message.topic.value != self._response_topic:
-                    await self._messages.put(message)
+                if message.topic.value != response_topic:
+                    await put_message(message)
                     continue
 
                 try:
@@ -558,11 +650,14 @@ class Client:
                     )
                     continue
 
-                if cid in self._pending_responses:
-                    response_future = self._pending_responses[cid]
-                    response_future.set_result(message)
-                elif cid in self._pending_responses_queue:
-                    response_queue = self._pending_responses_queue[cid]
+                if cid in pending_responses:
+                    response_future = pending_responses[cid]
+                    # A duplicate response (e.g. a redelivery) must not
+                    # kill the listener with an InvalidStateError.
+                    if not response_future.done():
+                        response_future.set_result(message)
+                elif cid in pending_response_queues:
+                    response_queue = pending_response_queues[cid]
                     response_queue.put_nowait(message)
                 else:
                     _logger.warning(
@@ -675,7 +770,7 @@ class SubscribeContext(MessageContext):
     @property
     def qos(self) -> QoS:
         """The quality of service level for the subscription."""
-        return QoS(self.options.QoS)
+        return _QOS_BY_VALUE[self.options.QoS]
 
     @qos.setter
     def qos(self, value: QoS) -> None:
@@ -731,3 +826,14 @@ class RequestContext(PublishContext):
 @dataclasses.dataclass(eq=False, match_args=False, kw_only=True, slots=True)
 class StreamContext(RequestContext):
     """Context for a stream operation."""
+
+
+# Shared fallback contexts for calls without an explicit context. The
+# client only reads from these, so a single instance per operation type
+# can be reused across calls. Request and stream contexts are excluded:
+# they get per-call correlation data written into their properties.
+_DEFAULT_PUBLISH_CONTEXT: typing.Final[PublishContext] = PublishContext()
+_DEFAULT_SUBSCRIBE_CONTEXT: typing.Final[SubscribeContext] = SubscribeContext()
+_DEFAULT_UNSUBSCRIBE_CONTEXT: typing.Final[UnsubscribeContext] = (
+    UnsubscribeContext()
+)
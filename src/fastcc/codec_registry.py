@@ -1,18 +1,42 @@
 import typing
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
     from fastcc.codecs import Codec
 
-from fastcc.codecs import BytesCodec, ProtobufCodec, StringCodec
+from fastcc.codecs import (
+    BoolCodec,
+    BytesCodec,
+    FloatCodec,
+    IntCodec,
+    ProtobufCodec,
+    StringCodec,
+)
 from fastcc.exceptions import CodecError, CodecNotFoundError
 
+# Sample values used to pre-resolve the encode cache for the common
+# payload types whenever the registry changes, so even the first
+# publish of such a type skips the codec scan.
+_ENCODE_CACHE_SEEDS: typing.Final[tuple[typing.Any, ...]] = (
+    b"",
+    "",
+    False,
+    0,
+    0.0,
+)
+
 
 class CodecRegistry:
     """Registry for codecs that can parse values to and from bytes."""
 
+    __slots__ = ("_codecs_by_type", "_encode_cache")
+
     def __init__(self) -> None:
+        # Insertion-ordered, so iterating the values doubles as the
+        # codec scan order.
         self._codecs_by_type: dict[int, Codec] = {}
-        self._codecs_in_order: list[Codec] = []
+        self._encode_cache: dict[type, Callable[[typing.Any], bytes]] = {}
 
     def register(self, codec: Codec, *, overwrite: bool = False) -> None:
         """Add a codec to the registry.
@@ -30,19 +54,28 @@ class CodecRegistry:
             If a codec of the same type is already registered and
             ``overwrite`` is ``False``.
         """
-        if codec.codec_type in self._codecs_by_type:
-            if not overwrite:
-                error_message = (
-                    f"Codec type {codec.codec_type!r} is already "
-                    f"registered. Use overwrite to replace it."
-                )
-                raise ValueError(error_message)
-
-            old = self._codecs_by_type[codec.codec_type]
-            self._codecs_in_order.remove(old)
-
+        if codec.codec_type in self._codecs_by_type and not overwrite:
+            error_message = (
+                f"Codec type {codec.codec_type!r} is already "
+                f"registered. Use overwrite to replace it."
+            )
+            raise ValueError(error_message)
+
+        # Overwriting keeps the codec's original position in the scan
+        # order; new codecs are scanned last.
         self._codecs_by_type[codec.codec_type] = codec
-        self._codecs_in_order.append(codec)
+        self.__reseed_encode_cache()
+
+    def __reseed_encode_cache(self) -> None:
+        # Resolve the cache entries through the regular codec scan so
+        # the cache always honors registration order - including custom
+        # codecs registered for the common payload types.
+        self._encode_cache.clear()
+        for seed in _ENCODE_CACHE_SEEDS:
+            for codec in self._codecs_by_type.values():
+                if codec.can_encode(seed):
+                    self._encode_cache[type(seed)] = codec.encode
+                    break
 
     def encode(
         self,
@@ -89,8 +122,22 @@ class CodecRegistry:
 
             return selected.encode(value)
 
-        for codec in self._codecs_in_order:
+        # ``None`` stands for an empty payload (see ``Client.publish``)
+        # and must not reach the codec scan, which would reject it.
+        if value is None:
+            return b""
+
+        # The codec scan is O(codecs) with a can_encode call per codec,
+        # so remember the bound encode method of the codec that claimed
+        # each concrete type. The cache is reseeded whenever the
+        # registry changes.
+        value_type = type(value)
+        if (cached := self._encode_cache.get(value_type)) is not None:
+            return cached(value)
+
+        for codec in self._codecs_by_type.values():
             if codec.can_encode(value):
+                self._encode_cache[value_type] = codec.encode
                 return codec.encode(value)
 
         error_message = f"No compatible codec found for value: {value!r}"
@@ -145,7 +192,7 @@ class CodecRegistry:
 
             return selected.decode(data, target_type)
 
-        for codec in self._codecs_in_order:
+        for codec in self._codecs_by_type.values():
             if codec.can_decode(target_type):
                 return codec.decode(data, target_type)
 
@@ -160,6 +207,9 @@ def _build_default_registry() -> CodecRegistry:
     registry.register(BytesCodec())
     registry.register(StringCodec())
     registry.register(ProtobufCodec())
+    registry.register(BoolCodec())
+    registry.register(FloatCodec())
+    registry.register(IntCodec())
     return registry
 
 
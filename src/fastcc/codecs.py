@@ -1,8 +1,40 @@
 import enum
+import struct
+import sys
 import typing
 
 from google.protobuf.message import Message
 
+from fastcc.constants import BOOL_BYTES
+
+# Precompiled once so encoding does not re-parse the format string and
+# allocate a Struct per call.
+_FLOAT_STRUCT: typing.Final[struct.Struct] = struct.Struct("!d")
+
+# Prebuilt encodings for the single-byte integer range, which
+# dominates typical command payloads.
+_SMALL_INT_OFFSET: typing.Final[int] = 128
+_SMALL_INT_BYTES: typing.Final[tuple[bytes, ...]] = tuple(
+    value.to_bytes(1, "big", signed=True)
+    for value in range(-_SMALL_INT_OFFSET, _SMALL_INT_OFFSET)
+)
+
+# Decoded strings up to this length are interned so that repeated
+# payloads share a single object and later equality checks and dict
+# lookups reduce to pointer comparisons. Longer strings rarely repeat
+# and would only grow the intern table.
+_INTERN_THRESHOLD: typing.Final[int] = 64
+
+# Unpacking a precompiled struct is about twice as fast as
+# ``int.from_bytes`` for the fixed widths it supports; other widths
+# fall back to ``int.from_bytes``.
+_INT_STRUCTS: typing.Final[dict[int, struct.Struct]] = {
+    1: struct.Struct(">b"),
+    2: struct.Struct(">h"),
+    4: struct.Struct(">i"),
+    8: struct.Struct(">q"),
+}
+
 
 class CodecType(enum.IntEnum):
     """Enumeration of codec types."""
@@ -16,6 +48,15 @@ class CodecType(enum.IntEnum):
     PROTOBUF = 3
     """Codec for encoding and decoding protobuf messages."""
 
+    BOOL = 4
+    """Codec for encoding and decoding booleans."""
+
+    FLOAT = 5
+    """Codec for encoding and decoding floats."""
+
+    INT = 6
+    """Codec for encoding and decoding integers."""
+
 
 class Codec(typing.Protocol):
     """Protocol for codecs that can parse values to and from bytes."""
@@ -107,6 +148,8 @@ class Codec(typing.Protocol):
 class BytesCodec:
     """Codec for encoding and decoding bytes."""
 
+    __slots__ = ()
+
     codec_type = CodecType.BYTES.value
 
     def can_encode(self, value: typing.Any) -> bool:
@@ -125,10 +168,22 @@ class BytesCodec:
 
 
 class StringCodec:
-    """Codec for encoding and decoding strings."""
+    """Codec for encoding and decoding strings.
+
+    Parameters
+    ----------
+    intern_strings
+        Whether to intern short decoded strings. Repeated payloads
+        then share a single string object.
+    """
+
+    __slots__ = ("_intern_strings",)
 
     codec_type = CodecType.STRING.value
 
+    def __init__(self, *, intern_strings: bool = True) -> None:
+        self._intern_strings = intern_strings
+
     def can_encode(self, value: typing.Any) -> bool:
         return isinstance(value, str)
 
@@ -141,12 +196,104 @@ class StringCodec:
 
     def decode[T](self, data: bytes, target_type: type[T]) -> T:
         assert self.can_decode(target_type)
-        return data.decode()  # type: ignore[return-value]
+        value = data.decode()
+        if self._intern_strings and len(value) <= _INTERN_THRESHOLD:
+            return sys.intern(value)  # type: ignore[return-value]
+
+        return value  # type: ignore[return-value]
+
+
+class BoolCodec:
+    """Codec for encoding and decoding booleans."""
+
+    __slots__ = ()
+
+    codec_type = CodecType.BOOL.value
+
+    def can_encode(self, value: typing.Any) -> bool:
+        return isinstance(value, bool)
+
+    def can_decode(self, target_type: type[typing.Any]) -> bool:
+        return target_type is bool
+
+    def encode(self, value: bool) -> bytes:  # noqa: FBT001
+        assert self.can_encode(value)
+        # Indexing the pair is branchless; bool is a valid index.
+        return BOOL_BYTES[value]
+
+    def decode[T](self, data: bytes, target_type: type[T]) -> T:
+        assert self.can_decode(target_type)
+        return data == BOOL_BYTES[1]  # type: ignore[return-value]
+
+
+class IntCodec:
+    """Codec for encoding and decoding integers.
+
+    Integers are encoded big-endian and signed, using the minimal
+    number of bytes that preserves the sign.
+    """
+
+    __slots__ = ()
+
+    codec_type = CodecType.INT.value
+
+    def can_encode(self, value: typing.Any) -> bool:
+        # bool is an int subclass but has its own codec.
+        return isinstance(value, int) and not isinstance(value, bool)
+
+    def can_decode(self, target_type: type[typing.Any]) -> bool:
+        return target_type is int
+
+    def encode(self, value: int) -> bytes:
+        assert self.can_encode(value)
+        if -_SMALL_INT_OFFSET <= value < _SMALL_INT_OFFSET:
+            return _SMALL_INT_BYTES[value + _SMALL_INT_OFFSET]
+
+        return value.to_bytes(
+            (value.bit_length() + 8) // 8,
+            "big",
+            signed=True,
+        )
+
+    def decode[T](self, data: bytes, target_type: type[T]) -> T:
+        assert self.can_decode(target_type)
+        if (fixed := _INT_STRUCTS.get(len(data))) is not None:
+            return fixed.unpack(data)[0]  # type: ignore[return-value]
+
+        return int.from_bytes(data, "big", signed=True)  # type: ignore[return-value]
+
+
+class FloatCodec:
+    """Codec for encoding and decoding floats.
+
+    Floats are encoded as IEEE 754 double-precision values in network
+    byte order.
+    """
+
+    __slots__ = ()
+
+    codec_type = CodecType.FLOAT.value
+
+    def can_encode(self, value: typing.Any) -> bool:
+        return isinstance(value, float)
+
+    def can_decode(self, target_type: type[typing.Any]) -> bool:
+        return target_type is float
+
+    def encode(self, value: float) -> bytes:
+        assert self.can_encode(value)
+        return _FLOAT_STRUCT.pack(value)
+
+    def decode[T](self, data: bytes, target_type: type[T]) -> T:
+        assert self.can_decode(target_type)
+        return _FLOAT_STRUCT.unpack_from(data)[0]  # type: ignore[return-value]
 
 
 class ProtobufCodec:
     """Codec for encoding and decoding protobuf messages."""
 
+    __slots__ = ()
+
     codec_type = CodecType.PROTOBUF.value
 
     def can_encode(self, value: typing.Any) -> bool:
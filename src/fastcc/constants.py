@@ -17,12 +17,21 @@ DEFAULT_RESPONSE_TOPIC: typing.Final[str] = TOPIC_SEPARATOR.join((
 ))
 """Default topic used for receiving responses in request/response communication."""  # noqa: E501
 
+DEFAULT_STREAM_WINDOW: typing.Final[int] = 32
+"""Default number of in-flight publishes for streamed responses."""
+
+DEFAULT_CONCURRENCY_LIMIT: typing.Final[int] = 1024
+"""Default number of concurrently handled incoming messages."""
+
 STATUS_CODE_SUCCESS: typing.Final[int] = 0
 """Status code indicating a successful operation."""
 
 STATUS_CODE_FAILURE: typing.Final[int] = -1
 """Status code indicating a failed operation."""
 
+BOOL_BYTES: typing.Final[tuple[bytes, bytes]] = (b"\x00", b"\x01")
+"""Wire representations of ``False`` and ``True``, indexable by value."""
+
 PATH_PARAMETER_PATTERN: typing.Final[str] = r"\{(\w+)\}"
 """Regular expression pattern for matching path parameters in topic patterns."""
 
@@ -31,26 +31,35 @@ class Route:
     injectors: frozenset[str] = dataclasses.field(init=False)
     payload_type: type[typing.Any] = dataclasses.field(init=False)
     return_type: type[typing.Any] = dataclasses.field(init=False)
+    is_async_gen: bool = dataclasses.field(init=False)
 
     def __post_init__(self) -> None:
         _validate_pattern(self.pattern)
-        _validate_handler(self.handler, self.pattern)
+
+        signature = inspect.signature(self.handler)
+        path_parameters = _extract_path_parameters(self.pattern)
+        _validate_handler(self.handler, signature, path_parameters)
 
         object.__setattr__(self, "regex", _compile_pattern(self.pattern))
         object.__setattr__(
             self,
             "injectors",
-            _extract_injectors(self.handler, self.pattern),
+            _extract_injectors(signature, path_parameters),
         )
         object.__setattr__(
             self,
             "payload_type",
-            _extract_payload_type(self.handler),
+            _extract_payload_type(signature),
         )
         object.__setattr__(
             self,
             "return_type",
-            _extract_return_type(self.handler),
+            _extract_return_type(signature),
+        )
+        object.__setattr__(
+            self,
+            "is_async_gen",
+            inspect.isasyncgenfunction(self.handler),
         )
 
     async def __call__(
@@ -143,12 +152,26 @@ def _validate_pattern(pattern: str) -> None:
                 raise RouteValidationError(error_message)
 
 
-def _validate_handler(handler: Routable, pattern: str) -> None:
-    if not inspect.iscoroutinefunction(handler):
+def _extract_path_parameters(pattern: str) -> frozenset[str]:
+    path_parameters = set(re.findall(PATH_PARAMETER_PATTERN, pattern))
+    if MULTI_LEVEL_WILDCARD in pattern:
+        path_parameters.add(WILDCARD_PARAMETER_NAME)
+
+    return frozenset(path_parameters)
+
+
+def _validate_handler(
+    handler: Routable,
+    signature: inspect.Signature,
+    path_parameters: frozenset[str],
+) -> None:
+    if not (
+        inspect.iscoroutinefunction(handler)
+        or inspect.isasyncgenfunction(handler)
+    ):
         error_message = f"Route handler {handler!r} must be asynchronous"
         raise RouteValidationError(error_message)
 
-    signature = inspect.signature(handler)
     positional_params = [
         p
         for p in signature.parameters.values()
@@ -171,10 +194,6 @@ def _validate_handler(handler: Routable, pattern: str) -> None:
         for p in signature.parameters.values()
         if p.kind == inspect.Parameter.KEYWORD_ONLY
     }
-    path_parameters: set[str] = set(re.findall(PATH_PARAMETER_PATTERN, pattern))
-    if MULTI_LEVEL_WILDCARD in pattern:
-        path_parameters.add(WILDCARD_PARAMETER_NAME)
-
     missing = path_parameters - keyword_only_params
     if missing:
         error_message = (
@@ -196,22 +215,19 @@ def _compile_pattern(pattern: str) -> re.Pattern:
     return re.compile(pattern)
 
 
-def _extract_injectors(handler: Routable, pattern: str) -> frozenset[str]:
-    signature = inspect.signature(handler)
+def _extract_injectors(
+    signature: inspect.Signature,
+    path_parameters: frozenset[str],
+) -> frozenset[str]:
     keyword_only_params = {
         p.name
         for p in signature.parameters.values()
         if p.kind == inspect.Parameter.KEYWORD_ONLY
     }
-    path_parameters: set[str] = set(re.findall(PATH_PARAMETER_PATTERN, pattern))
-    if MULTI_LEVEL_WILDCARD in pattern:
-        path_parameters.add(WILDCARD_PARAMETER_NAME)
-
     return frozenset(keyword_only_params - path_parameters)
 
 
-def _extract_payload_type(handler: Routable) -> type[typing.Any]:
-    signature = inspect.signature(handler)
+def _extract_payload_type(signature: inspect.Signature) -> type[typing.Any]:
     positional_params = [
         p
         for p in signature.parameters.values()
@@ -225,6 +241,5 @@ def _extract_payload_type(handler: Routable) -> type[typing.Any]:
     return payload_param.annotation  # type: ignore[no-any-return]
 
 
-def _extract_return_type(handler: Routable) -> type[typing.Any]:
-    signature = inspect.signature(handler)
+def _extract_return_type(signature: inspect.Signature) -> type[typing.Any]:
     return signature.return_annotation  # type: ignore[no-any-return]
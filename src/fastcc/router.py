@@ -1,10 +1,13 @@
 import asyncio
+import collections
+import functools
 import logging
 import re
+import types
 import typing
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable, Mapping, Sequence
 
     import aiomqtt
 
@@ -16,17 +19,25 @@ import paho.mqtt.properties as paho_properties
 
 from fastcc.client import PublishContext, SubscribeContext
 from fastcc.constants import (
+    DEFAULT_CONCURRENCY_LIMIT,
+    DEFAULT_STREAM_WINDOW,
+    MULTI_LEVEL_WILDCARD,
     PATH_PARAMETER_PATTERN,
     SINGLE_LEVEL_WILDCARD,
     STATUS_CODE_FAILURE,
     STATUS_CODE_SUCCESS,
     TOPIC_SEPARATOR,
+    WILDCARD_PARAMETER_NAME,
 )
 from fastcc.qos import QoS
 from fastcc.route import Routable, Route
 
 _logger = logging.getLogger(__name__)
 
+_RESOLVE_CACHE_SIZE: typing.Final[int] = 1024
+
+type _Dispatcher = Callable[..., Awaitable[None]]
+
 
 class Router:
     """MQTT topic router for registering and resolving handlers.
@@ -42,6 +53,15 @@ class Router:
     prefix
         A topic prefix prepended to every route registered on this
         router. Defaults to an empty string (no prefix).
+    stream_window
+        The maximum number of in-flight publishes when a streaming
+        (async-generator) handler yields responses. Publishes are
+        pipelined up to this limit instead of being awaited one by
+        one.
+    concurrency_limit
+        The maximum number of incoming messages handled concurrently.
+        When the limit is reached, message intake pauses until a
+        handler finishes, bounding memory growth under load.
 
     Examples
     --------
@@ -51,10 +71,46 @@ class Router:
     ...     pass
     """
 
-    def __init__(self, prefix: str = "") -> None:
+    __slots__ = (
+        "_concurrency_limit",
+        "_injector_cache",
+        "_injector_epoch",
+        "_injectors",
+        "_literal_routes",
+        "_pattern_trie",
+        "_prefix",
+        "_required_injectors",
+        "_resolve_cache",
+        "_route_dispatchers",
+        "_routes",
+        "_stream_window",
+    )
+
+    def __init__(
+        self,
+        prefix: str = "",
+        *,
+        stream_window: int = DEFAULT_STREAM_WINDOW,
+        concurrency_limit: int = DEFAULT_CONCURRENCY_LIMIT,
+    ) -> None:
         self._prefix = prefix.rstrip(TOPIC_SEPARATOR)
+        self._stream_window = stream_window
+        self._concurrency_limit = concurrency_limit
         self._routes: set[Route] = set()
+        self._literal_routes: dict[str, list[Route]] = {}
+        self._pattern_trie = _TrieNode()
+        self._route_dispatchers: dict[Route, _Dispatcher] = {}
+        self._required_injectors: set[str] = set()
+        self._resolve_cache: collections.OrderedDict[
+            str,
+            list[tuple[Route, dict[str, str]]],
+        ] = collections.OrderedDict()
         self._injectors: dict[str, typing.Any] = {}
+        self._injector_epoch = 0
+        self._injector_cache: dict[
+            Route,
+            tuple[int, Mapping[str, typing.Any]],
+        ] = {}
 
     @property
     def routes(self) -> set[Route]:
@@ -75,10 +131,45 @@ class Router:
             A tuple containing the matching route and path parameters if found,
             otherwise ``(None, {})``.
         """
-        for route in self._routes:
-            if (match := route.match(topic)) is not None:
-                return route, match.groupdict()
-        return None, {}
+        literal_routes = self._literal_routes.get(topic)
+        if literal_routes:
+            return literal_routes[0], {}
+
+        return _trie_first(self._pattern_trie, _split_topic(topic), 0, {})
+
+    def get_all(self, topic: str) -> list[tuple[Route, dict[str, str]]]:
+        """Resolve a topic to all matching registered routes.
+
+        Parameters
+        ----------
+        topic
+            The MQTT topic to resolve.
+
+        Returns
+        -------
+        list[tuple[Route, dict[str, str]]]
+            All matching routes with their path parameters, in no
+            particular order. Empty if no route matches.
+        """
+        # Hits and stores copy the path-parameter dicts as well, so
+        # callers can never mutate what the cache holds.
+        cache = self._resolve_cache
+        if (cached := cache.get(topic)) is not None:
+            cache.move_to_end(topic)
+            return [(route, dict(parameters)) for route, parameters in cached]
+
+        matches: list[tuple[Route, dict[str, str]]] = [
+            (route, {}) for route in self._literal_routes.get(topic, ())
+        ]
+        _trie_collect(self._pattern_trie, _split_topic(topic), 0, {}, matches)
+
+        cache[topic] = [
+            (route, dict(parameters)) for route, parameters in matches
+        ]
+        if len(cache) > _RESOLVE_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return matches
 
     def route(
         self,
@@ -111,12 +202,31 @@ class Router:
             else:
                 full_pattern = pattern
 
-            self._routes.add(Route(full_pattern, func, context=context))
+            route = Route(full_pattern, func, context=context)
+            if route not in self._routes:
+                self._routes.add(route)
+                self.__index_route(route)
+
             _logger.debug("Registered route: %s -> %s", full_pattern, func)
             return func
 
         return decorator
 
+    def __index_route(self, route: Route) -> None:
+        if (
+            "{" not in route.pattern
+            and MULTI_LEVEL_WILDCARD not in route.pattern
+        ):
+            self._literal_routes.setdefault(route.pattern, []).append(route)
+        else:
+            _trie_insert(self._pattern_trie, route)
+
+        self._route_dispatchers[route] = (
+            self.__dispatch_stream if route.is_async_gen else self.__dispatch
+        )
+        self._required_injectors.update(route.injectors)
+        self._resolve_cache.clear()
+
     async def serve(self, client: Client) -> None:
         """Start the router to handle incoming messages from the MQTT client.
 
@@ -130,18 +240,37 @@ class Router:
             The MQTT client to use for subscribing and receiving
             messages.
         """
-        _validate_injectors(self._injectors, self._routes)
+        _validate_injectors(self._injectors, self._required_injectors)
 
-        for route in self._routes:
-            topic = _pattern_to_topic(route.pattern)
-            await client.subscribe(topic, context=route.context)
+        await asyncio.gather(
+            *(
+                client.subscribe(
+                    _pattern_to_topic(route.pattern),
+                    context=route.context,
+                )
+                for route in self._routes
+            ),
+        )
 
+        semaphore = asyncio.Semaphore(self._concurrency_limit)
         tasks: set[asyncio.Task[bytes | None]] = set()
+
+        def reap(task: asyncio.Task[bytes | None]) -> None:
+            tasks.discard(task)
+            semaphore.release()
+
+        # Hoist per-message lookups out of the ingest loop.
+        acquire = semaphore.acquire
+        create_task = asyncio.create_task
+        handle_message = self.__handle_message
+        add_task = tasks.add
+
         try:
             async for message in client.iter_messages():
-                t = asyncio.create_task(self.__handle_message(message, client))
-                tasks.add(t)
-                t.add_done_callback(tasks.discard)
+                await acquire()
+                t = create_task(handle_message(message, client))
+                add_task(t)
+                t.add_done_callback(reap)
         finally:
             await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -159,6 +288,7 @@ class Router:
             the corresponding injector values.
         """
         self._injectors.update(injectors)
+        self._injector_epoch += 1
 
     def add_router(self, router: Router) -> None:
         """Add routes from another router into this router.
@@ -175,12 +305,27 @@ class Router:
         for route in router.routes:
             self.route(route.pattern, context=route.context)(route.handler)
 
+    def __route_injectors(self, route: Route) -> Mapping[str, typing.Any]:
+        cached = self._injector_cache.get(route)
+        if cached is not None and cached[0] == self._injector_epoch:
+            return cached[1]
+
+        # The view is shared across all messages of the route, so hand
+        # out a read-only proxy instead of a fresh copy per call.
+        injectors = types.MappingProxyType({
+            name: self._injectors.get(name) for name in route.injectors
+        })
+        self._injector_cache[route] = (self._injector_epoch, injectors)
+        return injectors
+
     async def __handle_message(
         self,
         message: aiomqtt.Message,
         client: Client,
     ) -> None:
-        topic = message.topic.value
+        matches = self.get_all(message.topic.value)
+        if not matches:
+            return
 
         response_topic = None
         correlation_id = None
@@ -192,37 +337,77 @@ class Router:
                 None,
             )
 
-        route, path_parameters = self.get(topic)
-        if route is None:
+        if len(matches) == 1:
+            route, path_parameters = matches[0]
+            await self._route_dispatchers[route](
+                route,
+                path_parameters,
+                message,
+                client,
+                response_topic,
+                correlation_id,
+            )
             return
 
-        injectors = {
-            name: self._injectors.get(name) for name in route.injectors
-        }
+        # Routes sharing an immutable payload annotation also share the
+        # decoded value, so fan-out decodes such types at most once.
+        # Only the first match answers a request: responding from every
+        # overlapping route would publish several responses carrying
+        # the same correlation id.
+        decode_cache: dict[type, typing.Any] = {}
+        await asyncio.gather(
+            *(
+                self._route_dispatchers[route](
+                    route,
+                    path_parameters,
+                    message,
+                    client,
+                    response_topic if index == 0 else None,
+                    correlation_id if index == 0 else None,
+                    decode_cache=decode_cache,
+                )
+                for index, (route, path_parameters) in enumerate(matches)
+            ),
+            return_exceptions=True,
+        )
 
-        response_properties = paho_properties.Properties(
-            paho_packettypes.PacketTypes.PUBLISH,
+    async def __dispatch(  # noqa: PLR0913, PLR0917
+        self,
+        route: Route,
+        path_parameters: dict[str, str],
+        message: aiomqtt.Message,
+        client: Client,
+        response_topic: str | None,
+        correlation_id: bytes | None,
+        decode_cache: dict[type, typing.Any] | None = None,
+    ) -> None:
+        topic = message.topic.value
+        injectors = (
+            _EMPTY_PARAMETERS
+            if not route.injectors
+            else self.__route_injectors(route)
         )
-        status_code = STATUS_CODE_SUCCESS
-        try:
-            value = client.codec_registry.decode(
-                message.payload,
-                route.payload_type,
-            )
-            result = await route(
-                value,
-                **path_parameters,
-                **injectors,
-            )
-        except Exception as exc:  # noqa: BLE001
-            result = str(exc).encode()
-            status_code = (
-                exc.status_code
-                if hasattr(exc, "status_code")
-                else STATUS_CODE_FAILURE
-            )
+        packet_only = not path_parameters and not injectors
 
         if response_topic is None:
+            # Publish-only message: the handler runs for its side
+            # effects and no response machinery is set up at all.
+            try:
+                value = _decode_payload(route, message, client, decode_cache)
+                result = (
+                    await route(value)
+                    if packet_only
+                    else await route(value, **path_parameters, **injectors)
+                )
+            except Exception as exc:  # noqa: BLE001
+                _logger.warning(
+                    "Handler failed and no response topic was provided "
+                    "to report the error to (topic: %r): %s",
+                    topic,
+                    exc,
+                )
+                return
+
             if result is not None:
                 _logger.warning(
                     "Handler returned a result but no response topic "
@@ -232,6 +417,22 @@ class Router:
                 )
             return
 
+        status_code = STATUS_CODE_SUCCESS
+        try:
+            value = _decode_payload(route, message, client, decode_cache)
+            result = (
+                await route(value)
+                if packet_only
+                else await route(value, **path_parameters, **injectors)
+            )
+        except Exception as exc:  # noqa: BLE001
+            result = str(exc).encode()
+            status_code = (
+                exc.status_code
+                if hasattr(exc, "status_code")
+                else STATUS_CODE_FAILURE
+            )
+
         if correlation_id is None:
             _logger.warning(
                 "Malformed message: No correlation ID was provided in "
@@ -241,30 +442,316 @@ class Router:
             )
             return
 
-        response_properties.CorrelationData = correlation_id
-        response_properties.UserProperty = [
-            ("status_code", str(status_code)),
-        ]
-        context = PublishContext(
-            _properties=response_properties,
-            qos=QoS.AT_LEAST_ONCE,
+        context = _response_context(correlation_id, status_code)
+        await client.publish(response_topic, result, context=context)
+
+    async def __dispatch_stream(  # noqa: PLR0913, PLR0917
+        self,
+        route: Route,
+        path_parameters: dict[str, str],
+        message: aiomqtt.Message,
+        client: Client,
+        response_topic: str | None,
+        correlation_id: bytes | None,
+        decode_cache: dict[type, typing.Any] | None = None,  # noqa: ARG002
+    ) -> None:
+        topic = message.topic.value
+
+        if response_topic is None:
+            _logger.warning(
+                "Streaming handler has no response topic to publish "
+                "to; yielded responses will be discarded (topic: %r)",
+                topic,
+            )
+            return
+
+        if correlation_id is None:
+            _logger.warning(
+                "Malformed message: No correlation ID was provided "
+                "in the message properties; stream will be "
+                "discarded (topic: %r)",
+                topic,
+            )
+            return
+
+        injectors = self.__route_injectors(route)
+        parameters = (
+            injectors
+            if not path_parameters
+            else {**path_parameters, **injectors}
+        )
+        await self.__handle_stream(
+            route,
+            message,
+            client,
+            response_topic,
+            correlation_id,
+            parameters,
         )
 
-        await client.publish(response_topic, result, context=context)
+    async def __handle_stream(  # noqa: PLR0913, PLR0917
+        self,
+        route: Route,
+        message: aiomqtt.Message,
+        client: Client,
+        response_topic: str,
+        correlation_id: bytes,
+        parameters: Mapping[str, typing.Any],
+    ) -> None:
+        context = _response_context(correlation_id, STATUS_CODE_SUCCESS)
+        pending: collections.deque[asyncio.Task[None]] = collections.deque()
+        try:
+            value = client.codec_registry.decode(
+                message.payload,
+                route.payload_type,
+            )
+            async for result in route.handler(value, **parameters):
+                pending.append(
+                    asyncio.ensure_future(
+                        client.publish(response_topic, result, context=context),
+                    ),
+                )
+                if len(pending) >= self._stream_window:
+                    await pending.popleft()
+        except Exception as exc:  # noqa: BLE001
+            status_code = (
+                exc.status_code
+                if hasattr(exc, "status_code")
+                else STATUS_CODE_FAILURE
+            )
+            error_context = _response_context(correlation_id, status_code)
+            pending.append(
+                asyncio.ensure_future(
+                    client.publish(
+                        response_topic,
+                        str(exc).encode(),
+                        context=error_context,
+                    ),
+                ),
+            )
+        finally:
+            if pending:
+                results = await asyncio.gather(*pending, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, BaseException):
+                        _logger.warning(
+                            "Stream response publish failed (topic: %r): %s",
+                            response_topic,
+                            result,
+                        )
+
+            # An empty payload terminates the stream on the requesting
+            # side; it must go out even when a pipelined publish fails,
+            # or the requester blocks on the queue forever.
+            await client.publish(response_topic, b"", context=context)
+
+
+class _TrieNode:
+    """Node of the segment trie used for pattern-route matching.
+
+    Each node branches on one topic segment: ``children`` holds literal
+    segments, ``param_children`` holds path-parameter edges keyed by the
+    parameter name, ``routes`` holds the routes terminating at this
+    node, and ``wildcard_routes`` holds routes whose next (and last)
+    pattern segment is the multi-level wildcard.
+    """
+
+    __slots__ = ("children", "param_children", "routes", "wildcard_routes")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.param_children: dict[str, _TrieNode] = {}
+        self.routes: list[Route] = []
+        self.wildcard_routes: list[Route] = []
+
+
+def _trie_insert(root: _TrieNode, route: Route) -> None:
+    node = root
+    for segment in route.pattern.split(TOPIC_SEPARATOR):
+        if segment == MULTI_LEVEL_WILDCARD:
+            # Validated by the route to be the last pattern segment.
+            node.wildcard_routes.append(route)
+            return
+
+        if (match := re.fullmatch(PATH_PARAMETER_PATTERN, segment)) is None:
+            node = node.children.setdefault(segment, _TrieNode())
+        else:
+            node = node.param_children.setdefault(
+                match.group(1),
+                _TrieNode(),
+            )
+
+    node.routes.append(route)
+
+
+# Telemetry traffic is typically dominated by a small set of topics,
+# so remember their segment tuples instead of re-splitting per message.
+@functools.lru_cache(maxsize=1024)
+def _split_topic(topic: str) -> tuple[str, ...]:
+    return tuple(topic.split(TOPIC_SEPARATOR))
+
+
+def _trie_first(
+    node: _TrieNode,
+    segments: Sequence[str],
+    index: int,
+    parameters: dict[str, str],
+) -> tuple[Route | None, dict[str, str]]:
+    # Iterative depth-first walk. Entries are pushed in reverse
+    # precedence so literal children are explored before parameter
+    # edges, and a node's wildcard (the ``wildcard`` flag) only after
+    # both of its subtrees are exhausted.
+    length = len(segments)
+    stack: list[tuple[bool, _TrieNode, int, dict[str, str]]] = [
+        (False, node, index, parameters),
+    ]
+    while stack:
+        wildcard, node, index, parameters = stack.pop()
+        if wildcard:
+            bound = dict(parameters)
+            bound[WILDCARD_PARAMETER_NAME] = TOPIC_SEPARATOR.join(
+                segments[index:],
+            )
+            return node.wildcard_routes[0], bound
+
+        if index == length:
+            if node.routes:
+                return node.routes[0], dict(parameters)
+            continue
+
+        segment = segments[index]
+
+        # The multi-level wildcard consumes at least the topic
+        # separator, so it never matches when the topic ends here.
+        if node.wildcard_routes:
+            stack.append((True, node, index, parameters))
+
+        # Path parameters match any single non-empty segment.
+        if segment and node.param_children:
+            stack.extend(
+                (False, param_child, index + 1, {**parameters, name: segment})
+                for name, param_child in reversed(node.param_children.items())
+            )
+
+        if (child := node.children.get(segment)) is not None:
+            stack.append((False, child, index + 1, parameters))
+
+    return None, {}
+
+
+def _trie_collect(
+    node: _TrieNode,
+    segments: Sequence[str],
+    index: int,
+    parameters: dict[str, str],
+    matches: list[tuple[Route, dict[str, str]]],
+) -> None:
+    # Iterative depth-first walk visiting every matching subtree.
+    length = len(segments)
+    stack: list[tuple[_TrieNode, int, dict[str, str]]] = [
+        (node, index, parameters),
+    ]
+    while stack:
+        node, index, parameters = stack.pop()
+        if index == length:
+            matches.extend((route, dict(parameters)) for route in node.routes)
+            continue
+
+        segment = segments[index]
+        if node.wildcard_routes:
+            wildcard = TOPIC_SEPARATOR.join(segments[index:])
+            matches.extend(
+                (route, {**parameters, WILDCARD_PARAMETER_NAME: wildcard})
+                for route in node.wildcard_routes
+            )
+
+        if (child := node.children.get(segment)) is not None:
+            stack.append((child, index + 1, parameters))
+
+        if segment and node.param_children:
+            stack.extend(
+                (param_child, index + 1, {**parameters, name: segment})
+                for name, param_child in node.param_children.items()
+            )
+
+
+# Shared stand-in for routes that take no injectors, so the dispatcher
+# does not have to consult the injector cache for them at all.
+_EMPTY_PARAMETERS: typing.Final[Mapping[str, typing.Any]] = (
+    types.MappingProxyType({})
+)
+
+# Pre-built user-property lists for the status codes every response
+# carries, so the happy path and the generic failure path skip the
+# per-message str() call. The lists are shared and must not be mutated.
+_STATUS_USER_PROPERTIES: typing.Final[dict[int, list[tuple[str, str]]]] = {
+    status_code: [("status_code", str(status_code))]
+    for status_code in (STATUS_CODE_SUCCESS, STATUS_CODE_FAILURE)
+}
+
+
+# Payload types whose decoded values may be shared across fan-out
+# handlers. Mutable payloads (e.g. protobuf messages) must be decoded
+# per handler, or one handler mutating its input would corrupt its
+# concurrently running siblings.
+_SHAREABLE_PAYLOAD_TYPES: typing.Final[frozenset[type]] = frozenset({
+    bytes,
+    str,
+    int,
+    float,
+    bool,
+})
+
+
+def _decode_payload(
+    route: Route,
+    message: aiomqtt.Message,
+    client: Client,
+    decode_cache: dict[type, typing.Any] | None,
+) -> typing.Any:
+    payload_type = route.payload_type
+    if decode_cache is None or payload_type not in _SHAREABLE_PAYLOAD_TYPES:
+        return client.codec_registry.decode(message.payload, payload_type)
+
+    if payload_type in decode_cache:
+        return decode_cache[payload_type]
+
+    value = client.codec_registry.decode(message.payload, payload_type)
+    decode_cache[payload_type] = value
+    return value
+
+
+def _response_context(
+    correlation_id: bytes,
+    status_code: int,
+) -> PublishContext:
+    properties = paho_properties.Properties(
+        paho_packettypes.PacketTypes.PUBLISH,
+    )
+    properties.CorrelationData = correlation_id
+    user_properties = _STATUS_USER_PROPERTIES.get(status_code)
+    if user_properties is None:
+        user_properties = [("status_code", str(status_code))]
+
+    properties.UserProperty = user_properties
+    return PublishContext(_properties=properties, qos=QoS.AT_LEAST_ONCE)
 
 
 def _pattern_to_topic(pattern: str) -> str:
-    return re.sub(PATH_PARAMETER_PATTERN, SINGLE_LEVEL_WILDCARD, pattern)
+    # Path parameters are validated to occupy whole segments, so a
+    # plain split/join replaces the regex substitution.
+    return TOPIC_SEPARATOR.join(
+        SINGLE_LEVEL_WILDCARD
+        if segment.startswith("{") and segment.endswith("}")
+        else segment
+        for segment in pattern.split(TOPIC_SEPARATOR)
+    )
 
 
 def _validate_injectors(
     injectors: dict[str, typing.Any],
-    routes: set[Route],
+    required_injectors: set[str],
 ) -> None:
-    required_injectors: set[str] = set()
-    for route in routes:
-        required_injectors.update(route.injectors)
-
     missing = required_injectors - injectors.keys()
     if missing:
         error_message = (